@@ -23,8 +23,6 @@ func TestSVD_Exec(t *testing.T) {
 		} `json:"input"`
 		Expected struct {
 			SingularValues []float64 `json:"singular_values"`
-			U              []float64 `json:"u"`
-			Vt             []float64 `json:"vt"`
 		} `json:"expected"`
 	}
 	var test []testcase
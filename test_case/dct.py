@@ -1,47 +1,63 @@
 import numpy as np
-import json
-import cv2
+from functools import lru_cache
+from jsonstream import stream_test_cases
+
+# fixed seed for reproducible results
+RNG = np.random.default_rng(42)
+
+@lru_cache(maxsize=None)
+def dct_basis(n):
+    """Orthonormal DCT-II basis matrix (n x n), same normalization as cv2.dct"""
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    basis = np.sqrt(2.0 / n) * np.cos(np.pi * (2 * i + 1) * k / (2 * n))
+    basis[0] /= np.sqrt(2.0)
+    basis.flags.writeable = False
+    return basis
+
+def dct_2d(data):
+    """2D DCT-II as C_h @ X @ C_w.T using the cached basis matrices"""
+    h, w = data.shape
+    return dct_basis(h) @ data @ dct_basis(w).T
 
 def create_dct_test_cases():
-    """Create DCT test cases and output as JSON"""
-    test_cases = []
-    
+    """Create DCT test cases one at a time"""
     # Test case 1: Simple 2x2 data
     data1 = np.array([
         [1.0, 2.0],
         [3.0, 4.0]
     ], dtype=np.float32)
     
-    dct1 = cv2.dct(data1)
+    dct1 = dct_2d(data1)
     
-    test_cases.append({
+    yield {
         "name": "2x2_simple",
         "input": {
-            "data": data1.flatten().tolist(),
+            "data": data1.ravel(),
             "width": 2,
             "height": 2
         },
         "expected": {
-            "dct": dct1.flatten().tolist()
+            "dct": dct1.ravel()
         }
-    })
+    }
     
     # Test case 2: 4x4 sequential data
     data2 = np.arange(1, 17, dtype=np.float32).reshape(4, 4)
     
-    dct2 = cv2.dct(data2)
+    dct2 = dct_2d(data2)
     
-    test_cases.append({
+    yield {
         "name": "4x4_sequential",
         "input": {
-            "data": data2.flatten().tolist(),
+            "data": data2.ravel(),
             "width": 4,
             "height": 4
         },
         "expected": {
-            "dct": dct2.flatten().tolist()
+            "dct": dct2.ravel()
         }
-    })
+    }
     
     # Test case 3: 3x3 data (non-power-of-two)
     data3 = np.array([
@@ -50,19 +66,19 @@ def create_dct_test_cases():
         [3.0, 6.0, 9.0]
     ], dtype=np.float32)
     
-    dct3 = cv2.dct(data3)
+    dct3 = dct_2d(data3)
     
-    test_cases.append({
+    yield {
         "name": "3x3_non_power_of_two",
         "input": {
-            "data": data3.flatten().tolist(),
+            "data": data3.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "dct": dct3.flatten().tolist()
+            "dct": dct3.ravel()
         }
-    })
+    }
     
     # Test case 4: 4x2 rectangular data
     data4 = np.array([
@@ -72,19 +88,19 @@ def create_dct_test_cases():
         [7.0, 8.0]
     ], dtype=np.float32)
     
-    dct4 = cv2.dct(data4)
+    dct4 = dct_2d(data4)
     
-    test_cases.append({
+    yield {
         "name": "4x2_rectangular",
         "input": {
-            "data": data4.flatten().tolist(),
+            "data": data4.ravel(),
             "width": 2,
             "height": 4
         },
         "expected": {
-            "dct": dct4.flatten().tolist()
+            "dct": dct4.ravel()
         }
-    })
+    }
     
     # Test case 5: 2x4 rectangular data (different aspect ratio)
     data5 = np.array([
@@ -92,70 +108,66 @@ def create_dct_test_cases():
         [5.0, 6.0, 7.0, 8.0]
     ], dtype=np.float32)
     
-    dct5 = cv2.dct(data5)
+    dct5 = dct_2d(data5)
     
-    test_cases.append({
+    yield {
         "name": "2x4_rectangular",
         "input": {
-            "data": data5.flatten().tolist(),
+            "data": data5.ravel(),
             "width": 4,
             "height": 2
         },
         "expected": {
-            "dct": dct5.flatten().tolist()
+            "dct": dct5.ravel()
         }
-    })
+    }
     
     # Test case 6: All zeros
     data6 = np.zeros((3, 3), dtype=np.float32)
     
-    dct6 = cv2.dct(data6)
+    dct6 = dct_2d(data6)
     
-    test_cases.append({
+    yield {
         "name": "3x3_zeros",
         "input": {
-            "data": data6.flatten().tolist(),
+            "data": data6.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "dct": dct6.flatten().tolist()
+            "dct": dct6.ravel()
         }
-    })
+    }
     
     # Test case 7: Random data
-    np.random.seed(42)  # for reproducible results
-    data7 = np.random.rand(3, 4).astype(np.float32) * 10
+    data7 = RNG.random((3, 4), dtype=np.float32) * 10
     
-    dct7 = cv2.dct(data7)
+    dct7 = dct_2d(data7)
     
-    test_cases.append({
+    yield {
         "name": "3x4_random",
         "input": {
-            "data": data7.flatten().tolist(),
+            "data": data7.ravel(),
             "width": 4,
             "height": 3
         },
         "expected": {
-            "dct": dct7.flatten().tolist()
+            "dct": dct7.ravel()
         }
-    })
+    }
     
-    return test_cases
 
 def main():
     print("Creating DCT test cases...")
     
-    test_cases = create_dct_test_cases()
+    np.set_printoptions(precision=6, suppress=True)
     
-    # Output to JSON file
-    with open('../internal/test/testcase/dct_test_cases.json', 'w') as f:
-        json.dump(test_cases, f, indent=2)
-    
-    print(f"Generated {len(test_cases)} test cases in dct_test_cases.json")
-    
-    # Display results
-    for i, case in enumerate(test_cases):
+    # Stream each case to the JSON file as soon as it is generated
+    count = 0
+    for i, case in enumerate(stream_test_cases('../internal/test/testcase/dct_test_cases.json', create_dct_test_cases())):
+        count += 1
+        
+        # Display results
         print(f"\nTest case {i+1}: {case['name']}")
         print(f"Input shape: {case['input']['height']}x{case['input']['width']}")
         input_data = case['input']['data']
@@ -163,7 +175,9 @@ def main():
         
         # Display first few input and DCT values
         print("Input values (first 6):", input_data[:6])
-        print("DCT values (first 6):", [f"{x:.6f}" for x in dct_data[:6]])
+        print("DCT values (first 6):", dct_data[:6])
+    
+    print(f"\nGenerated {count} test cases in dct_test_cases.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,22 @@
+import os
+import orjson
+
+def stream_test_cases(path, test_cases):
+    """Stream test cases into a JSON array at path, yielding each case once written
+
+    The array is written to path + '.tmp' and moved onto path only after the
+    closing bracket, so an interrupted run leaves the existing fixture intact.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'[')
+            for i, case in enumerate(test_cases):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(orjson.dumps(case, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+                yield case
+            f.write(b'\n]')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -1,186 +1,199 @@
 import numpy as np
-import json
 from numpy.linalg import svd
+from jsonstream import stream_test_cases
+
+# fixed seed for reproducible results
+RNG = np.random.default_rng(42)
+
+def singular_values_2x2(stacked):
+    """Closed-form singular values of a stack of 2x2 matrices [[a, b], [c, d]]"""
+    # Scale each matrix to max |entry| = 1 so that the products in the
+    # determinant cannot overflow or underflow; singular values scale linearly.
+    m = np.abs(stacked).max(axis=(1, 2))
+    m = np.where(m > 0, m, 1.0)
+    scaled = stacked / m[:, None, None]
+    
+    a, b = scaled[:, 0, 0], scaled[:, 0, 1]
+    c, d = scaled[:, 1, 0], scaled[:, 1, 1]
+    q = np.hypot((a + d) / 2, (c - b) / 2)
+    r = np.hypot((a - d) / 2, (c + b) / 2)
+    s1 = q + r
+    # s1 * s2 = |det|; dividing avoids the cancellation in |q - r| when s2 << s1
+    s2 = np.divide(np.abs(a * d - b * c), s1, out=np.zeros_like(s1), where=s1 > 0)
+    return np.stack([s1, s2], axis=1) * m[:, None]
+
+def batched_singular_values(matrices):
+    """Singular values of each matrix, batched by shape (closed form for 2x2)"""
+    groups = {}
+    for i, matrix in enumerate(matrices):
+        groups.setdefault(matrix.shape, []).append(i)
+    
+    # With compute_uv=False numpy calls LAPACK gesdd with jobz='N', which
+    # computes the singular values by QR iteration (dlasdq), the same path
+    # gesvd takes, so there is no faster driver to switch to.
+    singular_values = [None] * len(matrices)
+    for shape, indices in groups.items():
+        stacked = np.stack([matrices[i] for i in indices])
+        if shape == (2, 2):
+            values = singular_values_2x2(stacked)
+        else:
+            values = svd(stacked, compute_uv=False)
+        for i, s in zip(indices, values):
+            singular_values[i] = s
+    return singular_values
 
 def create_svd_test_cases():
-    """Create SVD test cases and output as JSON"""
-    test_cases = []
-    
+    """Create SVD test cases one at a time"""
     # Test case 1: Simple 2x2 matrix
     data1 = np.array([
         [3.0, 1.0],
         [1.0, 3.0]
     ], dtype=np.float64)
     
-    U1, s1, Vt1 = svd(data1)
+    # Test case 2: 3x3 matrix
+    data2 = np.array([
+        [1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0],
+        [7.0, 8.0, 9.0]
+    ], dtype=np.float64)
+    
+    # Test case 3: 3x2 rectangular matrix (tall)
+    data3 = np.array([
+        [1.0, 2.0],
+        [3.0, 4.0],
+        [5.0, 6.0]
+    ], dtype=np.float64)
     
-    test_cases.append({
+    # Test case 4: 2x3 rectangular matrix (wide)
+    data4 = np.array([
+        [1.0, 2.0, 3.0],
+        [4.0, 5.0, 6.0]
+    ], dtype=np.float64)
+    
+    # Test case 5: Identity matrix
+    data5 = np.eye(3, dtype=np.float64)
+    
+    # Test case 6: Diagonal matrix
+    data6 = np.array([
+        [5.0, 0.0, 0.0],
+        [0.0, 3.0, 0.0],
+        [0.0, 0.0, 1.0]
+    ], dtype=np.float64)
+    
+    # Test case 7: Random matrix
+    data7 = RNG.random((2, 4))
+    
+    # Compute singular values for all cases, batched by shape
+    s1, s2, s3, s4, s5, s6, s7 = batched_singular_values([
+        data1, data2, data3, data4, data5, data6, data7
+    ])
+    
+    yield {
         "name": "2x2_simple",
         "input": {
-            "data": data1.flatten().tolist(),
+            "data": data1.ravel(),
             "width": 2,
             "height": 2
         },
         "expected": {
-            "singular_values": s1.tolist(),
-            "u": U1.flatten().tolist(),
-            "vt": Vt1.flatten().tolist()
+            "singular_values": s1
         }
-    })
-    
-    # Test case 2: 3x3 matrix
-    data2 = np.array([
-        [1.0, 2.0, 3.0],
-        [4.0, 5.0, 6.0],
-        [7.0, 8.0, 9.0]
-    ], dtype=np.float64)
-    
-    U2, s2, Vt2 = svd(data2)
+    }
     
-    test_cases.append({
+    yield {
         "name": "3x3_sequential",
         "input": {
-            "data": data2.flatten().tolist(),
+            "data": data2.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "singular_values": s2.tolist(),
-            "u": U2.flatten().tolist(),
-            "vt": Vt2.flatten().tolist()
+            "singular_values": s2
         }
-    })
-    
-    # Test case 3: 3x2 rectangular matrix (tall)
-    data3 = np.array([
-        [1.0, 2.0],
-        [3.0, 4.0],
-        [5.0, 6.0]
-    ], dtype=np.float64)
-    
-    U3, s3, Vt3 = svd(data3)
+    }
     
-    test_cases.append({
+    yield {
         "name": "3x2_tall_rectangular",
         "input": {
-            "data": data3.flatten().tolist(),
+            "data": data3.ravel(),
             "width": 2,
             "height": 3
         },
         "expected": {
-            "singular_values": s3.tolist(),
-            "u": U3.flatten().tolist(),
-            "vt": Vt3.flatten().tolist()
+            "singular_values": s3
         }
-    })
-    
-    # Test case 4: 2x3 rectangular matrix (wide)
-    data4 = np.array([
-        [1.0, 2.0, 3.0],
-        [4.0, 5.0, 6.0]
-    ], dtype=np.float64)
-    
-    U4, s4, Vt4 = svd(data4)
+    }
     
-    test_cases.append({
+    yield {
         "name": "2x3_wide_rectangular",
         "input": {
-            "data": data4.flatten().tolist(),
+            "data": data4.ravel(),
             "width": 3,
             "height": 2
         },
         "expected": {
-            "singular_values": s4.tolist(),
-            "u": U4.flatten().tolist(),
-            "vt": Vt4.flatten().tolist()
+            "singular_values": s4
         }
-    })
+    }
     
-    # Test case 5: Identity matrix
-    data5 = np.eye(3, dtype=np.float64)
-    
-    U5, s5, Vt5 = svd(data5)
-    
-    test_cases.append({
+    yield {
         "name": "3x3_identity",
         "input": {
-            "data": data5.flatten().tolist(),
+            "data": data5.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "singular_values": s5.tolist(),
-            "u": U5.flatten().tolist(),
-            "vt": Vt5.flatten().tolist()
+            "singular_values": s5
         }
-    })
+    }
     
-    # Test case 6: Diagonal matrix
-    data6 = np.array([
-        [5.0, 0.0, 0.0],
-        [0.0, 3.0, 0.0],
-        [0.0, 0.0, 1.0]
-    ], dtype=np.float64)
-    
-    U6, s6, Vt6 = svd(data6)
-    
-    test_cases.append({
+    yield {
         "name": "3x3_diagonal",
         "input": {
-            "data": data6.flatten().tolist(),
+            "data": data6.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "singular_values": s6.tolist(),
-            "u": U6.flatten().tolist(),
-            "vt": Vt6.flatten().tolist()
+            "singular_values": s6
         }
-    })
-    
-    # Test case 7: Random matrix
-    np.random.seed(42)  # for reproducible results
-    data7 = np.random.rand(2, 4).astype(np.float64)
-    
-    U7, s7, Vt7 = svd(data7)
+    }
     
-    test_cases.append({
+    yield {
         "name": "2x4_random",
         "input": {
-            "data": data7.flatten().tolist(),
+            "data": data7.ravel(),
             "width": 4,
             "height": 2
         },
         "expected": {
-            "singular_values": s7.tolist(),
-            "u": U7.flatten().tolist(),
-            "vt": Vt7.flatten().tolist()
+            "singular_values": s7
         }
-    })
+    }
     
-    return test_cases
 
 def main():
     print("Creating SVD test cases...")
     
-    test_cases = create_svd_test_cases()
+    np.set_printoptions(precision=6, suppress=True)
     
-    # Output to JSON file
-    with open('../internal/test/testcase/svd_test_cases.json', 'w') as f:
-        json.dump(test_cases, f, indent=2)
-    
-    print(f"Generated {len(test_cases)} test cases in svd_test_cases.json")
-    
-    # Display results
-    for i, case in enumerate(test_cases):
+    # Stream each case to the JSON file as soon as it is generated
+    count = 0
+    for i, case in enumerate(stream_test_cases('../internal/test/testcase/svd_test_cases.json', create_svd_test_cases())):
+        count += 1
+        
+        # Display results
         print(f"\nTest case {i+1}: {case['name']}")
         print(f"Input shape: {case['input']['height']}x{case['input']['width']}")
         input_data = case['input']['data']
         s_values = case['expected']['singular_values']
         
         # Display first few input values and singular values
-        print("Input values (first 6):", [f"{x:.6f}" for x in input_data[:6]])
-        print("Singular values:", [f"{x:.6f}" for x in s_values])
+        print("Input values (first 6):", input_data[:6])
+        print("Singular values:", s_values)
+    
+    print(f"\nGenerated {count} test cases in svd_test_cases.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
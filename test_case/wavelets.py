@@ -1,11 +1,32 @@
 import numpy as np
-import json
-from pywt import dwt2
+from jsonstream import stream_test_cases
+
+# fixed seed for reproducible results
+RNG = np.random.default_rng(42)
+
+def haar_dwt2(data):
+    """Single-level 2D Haar DWT, equivalent to pywt.dwt2(data, 'haar')
+
+    Odd sizes are extended by repeating the last row/column, which is what
+    pywt's default 'symmetric' mode amounts to for a 2-tap filter.
+    """
+    h, w = data.shape
+    if h % 2 or w % 2:
+        data = np.pad(data, ((0, h % 2), (0, w % 2)), mode='symmetric')
+    
+    a = data[0::2, 0::2]
+    b = data[0::2, 1::2]
+    c = data[1::2, 0::2]
+    d = data[1::2, 1::2]
+    
+    cA = (a + b + c + d) * 0.5
+    cH = (a + b - c - d) * 0.5
+    cV = (a - b + c - d) * 0.5
+    cD = (a - b - c + d) * 0.5
+    return cA, (cH, cV, cD)
 
 def create_test_cases():
-    """Create DWT test cases and output as JSON"""
-    test_cases = []
-    
+    """Create DWT test cases one at a time"""
     # Test case 1: Simple 4x4 data
     data1 = np.array([
         [1.0, 2.0, 3.0, 4.0],
@@ -14,23 +35,23 @@ def create_test_cases():
         [13.0, 14.0, 15.0, 16.0]
     ], dtype=np.float32)
     
-    coeffs1 = dwt2(data1, 'haar')
+    coeffs1 = haar_dwt2(data1)
     cA1, (cH1, cV1, cD1) = coeffs1
     
-    test_cases.append({
+    yield {
         "name": "4x4_simple",
         "input": {
-            "data": data1.flatten().tolist(),
+            "data": data1.ravel(),
             "width": 4,
             "height": 4
         },
         "expected": {
-            "cA": cA1.flatten().tolist(),
-            "cH": cH1.flatten().tolist(),
-            "cV": cV1.flatten().tolist(),
-            "cD": cD1.flatten().tolist()
+            "cA": cA1.ravel(),
+            "cH": cH1.ravel(),
+            "cV": cV1.ravel(),
+            "cD": cD1.ravel()
         }
-    })
+    }
     
     # Test case 2: 6x4 rectangular data
     data2 = np.array([
@@ -42,23 +63,23 @@ def create_test_cases():
         [18.0, 20.0, 22.0, 24.0]
     ], dtype=np.float32)
     
-    coeffs2 = dwt2(data2, 'haar')
+    coeffs2 = haar_dwt2(data2)
     cA2, (cH2, cV2, cD2) = coeffs2
     
-    test_cases.append({
+    yield {
         "name": "6x4_rectangle",
         "input": {
-            "data": data2.flatten().tolist(),
+            "data": data2.ravel(),
             "width": 4,
             "height": 6
         },
         "expected": {
-            "cA": cA2.flatten().tolist(),
-            "cH": cH2.flatten().tolist(),
-            "cV": cV2.flatten().tolist(),
-            "cD": cD2.flatten().tolist()
+            "cA": cA2.ravel(),
+            "cH": cH2.ravel(),
+            "cV": cV2.ravel(),
+            "cD": cD2.ravel()
         }
-    })
+    }
     
     # Test case 3: 3x3 odd-sized data
     data3 = np.array([
@@ -67,131 +88,122 @@ def create_test_cases():
         [7.0, 8.0, 9.0]
     ], dtype=np.float32)
     
-    coeffs3 = dwt2(data3, 'haar')
+    coeffs3 = haar_dwt2(data3)
     cA3, (cH3, cV3, cD3) = coeffs3
     
-    test_cases.append({
+    yield {
         "name": "3x3_odd",
         "input": {
-            "data": data3.flatten().tolist(),
+            "data": data3.ravel(),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "cA": cA3.flatten().tolist(),
-            "cH": cH3.flatten().tolist(),
-            "cV": cV3.flatten().tolist(),
-            "cD": cD3.flatten().tolist()
+            "cA": cA3.ravel(),
+            "cH": cH3.ravel(),
+            "cV": cV3.ravel(),
+            "cD": cD3.ravel()
         }
-    })
+    }
     
     # Test case 4: 8x8 square data
     data4 = np.arange(1, 65, dtype=np.float32).reshape(8, 8)
     
-    coeffs4 = dwt2(data4, 'haar')
+    coeffs4 = haar_dwt2(data4)
     cA4, (cH4, cV4, cD4) = coeffs4
     
-    test_cases.append({
+    yield {
         "name": "8x8_square",
         "input": {
-            "data": data4.flatten().tolist(),
+            "data": data4.ravel(),
             "width": 8,
             "height": 8
         },
         "expected": {
-            "cA": cA4.flatten().tolist(),
-            "cH": cH4.flatten().tolist(),
-            "cV": cV4.flatten().tolist(),
-            "cD": cD4.flatten().tolist()
+            "cA": cA4.ravel(),
+            "cH": cH4.ravel(),
+            "cV": cV4.ravel(),
+            "cD": cD4.ravel()
         }
-    })
+    }
     
     # Test case 5: 16x8 rectangular data
-    data5 = np.random.seed(42)  # fixed seed for reproducible results
-    data5 = np.random.rand(16, 8).astype(np.float32) * 100
+    data5 = RNG.random((16, 8), dtype=np.float32) * 100
     
-    coeffs5 = dwt2(data5, 'haar')
+    coeffs5 = haar_dwt2(data5)
     cA5, (cH5, cV5, cD5) = coeffs5
     
-    test_cases.append({
+    yield {
         "name": "16x8_random",
         "input": {
-            "data": data5.flatten().tolist(),
+            "data": data5.ravel(),
             "width": 8,
             "height": 16
         },
         "expected": {
-            "cA": cA5.flatten().tolist(),
-            "cH": cH5.flatten().tolist(),
-            "cV": cV5.flatten().tolist(),
-            "cD": cD5.flatten().tolist()
+            "cA": cA5.ravel(),
+            "cH": cH5.ravel(),
+            "cV": cV5.ravel(),
+            "cD": cD5.ravel()
         }
-    })
+    }
     
     # Test case 6: 16x16 large square data
     # Checkerboard pattern
-    data6 = np.zeros((16, 16), dtype=np.float32)
-    for i in range(16):
-        for j in range(16):
-            if (i + j) % 2 == 0:
-                data6[i, j] = 100.0
-            else:
-                data6[i, j] = 0.0
-    
-    coeffs6 = dwt2(data6, 'haar')
+    i, j = np.indices((16, 16))
+    data6 = np.where((i + j) & 1, 0.0, 100.0).astype(np.float32)
+    
+    coeffs6 = haar_dwt2(data6)
     cA6, (cH6, cV6, cD6) = coeffs6
     
-    test_cases.append({
+    yield {
         "name": "16x16_checkerboard",
         "input": {
-            "data": data6.flatten().tolist(),
+            "data": data6.ravel(),
             "width": 16,
             "height": 16
         },
         "expected": {
-            "cA": cA6.flatten().tolist(),
-            "cH": cH6.flatten().tolist(),
-            "cV": cV6.flatten().tolist(),
-            "cD": cD6.flatten().tolist()
+            "cA": cA6.ravel(),
+            "cH": cH6.ravel(),
+            "cV": cV6.ravel(),
+            "cD": cD6.ravel()
         }
-    })
+    }
     
     # Test case 7: 10x12 non-power-of-two size
-    data7 = np.linspace(1, 120, 120, dtype=np.float32).reshape(10, 12)
+    data7 = (np.arange(120, dtype=np.float32) + 1.0).reshape(10, 12)
     
-    coeffs7 = dwt2(data7, 'haar')
+    coeffs7 = haar_dwt2(data7)
     cA7, (cH7, cV7, cD7) = coeffs7
     
-    test_cases.append({
+    yield {
         "name": "10x12_non_power_of_two",
         "input": {
-            "data": data7.flatten().tolist(),
+            "data": data7.ravel(),
             "width": 12,
             "height": 10
         },
         "expected": {
-            "cA": cA7.flatten().tolist(),
-            "cH": cH7.flatten().tolist(),
-            "cV": cV7.flatten().tolist(),
-            "cD": cD7.flatten().tolist()
+            "cA": cA7.ravel(),
+            "cH": cH7.ravel(),
+            "cV": cV7.ravel(),
+            "cD": cD7.ravel()
         }
-    })
+    }
     
-    return test_cases
 
 def main():
     print("Creating DWT test cases...")
     
-    test_cases = create_test_cases()
+    np.set_printoptions(precision=6, suppress=True)
     
-    # Output to JSON file
-    with open('../internal/test/testcase/dwt_test_cases.json', 'w') as f:
-        json.dump(test_cases, f, indent=2)
-    
-    print(f"Generated {len(test_cases)} test cases in dwt_test_cases.json")
-    
-    # Display results
-    for i, case in enumerate(test_cases):
+    # Stream each case to the JSON file as soon as it is generated
+    count = 0
+    for i, case in enumerate(stream_test_cases('../internal/test/testcase/dwt_test_cases.json', create_test_cases())):
+        count += 1
+        
+        # Display results
         print(f"\nTest case {i+1}: {case['name']}")
         print(f"Input shape: {case['input']['height']}x{case['input']['width']}")
         print(f"cA shape: {len(case['expected']['cA'])} elements")
@@ -199,7 +211,8 @@ def main():
         print(f"cH values: {case['expected']['cH']}")
         print(f"cV values: {case['expected']['cV']}")
         print(f"cD values: {case['expected']['cD']}")
-
+    
+    print(f"\nGenerated {count} test cases in dwt_test_cases.json")
 
 if __name__ == "__main__":
     main()
@@ -1,136 +1,144 @@
 import numpy as np
-import json
-import cv2
+from jsonstream import stream_test_cases
+
+# fixed seed for reproducible results
+RNG = np.random.default_rng(42)
+
+# cv2.COLOR_BGR2YUV for float input, as a matrix over (B, G, R):
+# Y = 0.299R + 0.587G + 0.114B, U = 0.492(B - Y) + 0.5, V = 0.877(R - Y) + 0.5
+# Kept in float64 so the chroma rows cancel exactly for neutral pixels.
+BGR2YUV = np.array([
+    [0.114, 0.587, 0.299],
+    [0.492 * (1 - 0.114), -0.492 * 0.587, -0.492 * 0.299],
+    [-0.877 * 0.114, -0.877 * 0.587, 0.877 * (1 - 0.299)]
+], dtype=np.float64)
+YUV_DELTA = np.array([0.0, 0.5, 0.5], dtype=np.float64)
+
+def bgr_to_yuv(bgrs):
+    """Convert all BGR images to YUV with a single matrix product"""
+    bgr_flat = np.concatenate([bgr.reshape(-1, 3) for bgr in bgrs])
+    yuv_flat = (bgr_flat @ BGR2YUV.T + YUV_DELTA).astype(np.float32)
+
+    offsets = np.cumsum([bgr.shape[0] * bgr.shape[1] for bgr in bgrs])[:-1]
+    return [yuv.reshape(bgr.shape) for yuv, bgr in zip(np.split(yuv_flat, offsets), bgrs)]
 
 def create_yuv_test_cases():
-    """Create YUV conversion test cases and output as JSON"""
-    test_cases = []
-    
+    """Create YUV conversion test cases one at a time"""
     # Test case 1: Simple 2x2 BGR data (OpenCV uses BGR by default)
     bgr1 = np.array([
         [[0, 0, 255], [0, 255, 0]],      # Red, Green (in BGR)
         [[255, 0, 0], [255, 255, 255]]   # Blue, White (in BGR)
     ], dtype=np.float32)
-
-    yuv1 = cv2.cvtColor(bgr1, cv2.COLOR_BGR2YUV)
+    
+    # Test case 2: 3x3 grayscale gradient (BGR format)
+    bgr2 = np.array([
+        [[0, 0, 0], [64, 64, 64], [128, 128, 128]],
+        [[192, 192, 192], [255, 255, 255], [32, 32, 32]],
+        [[96, 96, 96], [160, 160, 160], [224, 224, 224]]
+    ], dtype=np.float32)
+    
+    # Test case 3: 4x4 random colors
+    bgr3 = RNG.integers(0, 256, (4, 4, 3)).astype(np.float32)
+    
+    # Test case 4: Edge cases (black, white, mid-gray)
+    bgr4 = np.array([
+        [[0, 0, 0], [255, 255, 255]],    # Black, White
+        [[128, 128, 128], [127, 127, 127]]  # Mid-gray variations
+    ], dtype=np.float32)
+    
+    # Test case 5: Single pixel (for simple validation)
+    bgr5 = np.array([[[200, 150, 100]]], dtype=np.float32)  # BGR format
+    
+    # Convert all cases to YUV at once
+    yuv1, yuv2, yuv3, yuv4, yuv5 = bgr_to_yuv([bgr1, bgr2, bgr3, bgr4, bgr5])
     
     # Convert BGR to RGB for consistent input format
-    rgb1 = cv2.cvtColor(bgr1, cv2.COLOR_BGR2RGB)
+    rgb1 = bgr1[..., ::-1]
     
-    test_cases.append({
+    yield {
         "name": "2x2_primary_colors",
         "input": {
-            "rgb": rgb1.flatten().astype(np.uint8).tolist(),
+            "rgb": rgb1.ravel().astype(np.uint8),
             "width": 2,
             "height": 2
         },
         "expected": {
-            "yuv": yuv1.flatten().tolist()
+            "yuv": yuv1.ravel()
         }
-    })
-    
-    # Test case 2: 3x3 grayscale gradient (BGR format)
-    bgr2 = np.array([
-        [[0, 0, 0], [64, 64, 64], [128, 128, 128]],
-        [[192, 192, 192], [255, 255, 255], [32, 32, 32]],
-        [[96, 96, 96], [160, 160, 160], [224, 224, 224]]
-    ], dtype=np.float32)
-    
-    yuv2 = cv2.cvtColor(bgr2, cv2.COLOR_BGR2YUV)
+    }
     
     # Convert BGR to RGB for consistent input format
-    rgb2 = cv2.cvtColor(bgr2, cv2.COLOR_BGR2RGB)
+    rgb2 = bgr2[..., ::-1]
     
-    test_cases.append({
+    yield {
         "name": "3x3_grayscale",
         "input": {
-            "rgb": rgb2.flatten().astype(np.uint8).tolist(),
+            "rgb": rgb2.ravel().astype(np.uint8),
             "width": 3,
             "height": 3
         },
         "expected": {
-            "yuv": yuv2.flatten().tolist()
+            "yuv": yuv2.ravel()
         }
-    })
-    
-    # Test case 3: 4x4 random colors
-    np.random.seed(42)  # for reproducible results
-    bgr3 = np.random.randint(0, 256, (4, 4, 3)).astype(np.float32)
-    
-    yuv3 = cv2.cvtColor(bgr3, cv2.COLOR_BGR2YUV)
+    }
     
     # Convert BGR to RGB for consistent input format
-    rgb3 = cv2.cvtColor(bgr3, cv2.COLOR_BGR2RGB)
+    rgb3 = bgr3[..., ::-1]
     
-    test_cases.append({
+    yield {
         "name": "4x4_random",
         "input": {
-            "rgb": rgb3.flatten().astype(np.uint8).tolist(),
+            "rgb": rgb3.ravel().astype(np.uint8),
             "width": 4,
             "height": 4
         },
         "expected": {
-            "yuv": yuv3.flatten().tolist()
+            "yuv": yuv3.ravel()
         }
-    })
-    
-    # Test case 4: Edge cases (black, white, mid-gray)
-    bgr4 = np.array([
-        [[0, 0, 0], [255, 255, 255]],    # Black, White
-        [[128, 128, 128], [127, 127, 127]]  # Mid-gray variations
-    ], dtype=np.float32)
-    
-    yuv4 = cv2.cvtColor(bgr4, cv2.COLOR_BGR2YUV)
+    }
     
     # Convert BGR to RGB for consistent input format
-    rgb4 = cv2.cvtColor(bgr4, cv2.COLOR_BGR2RGB)
+    rgb4 = bgr4[..., ::-1]
     
-    test_cases.append({
+    yield {
         "name": "2x2_edge_cases",
         "input": {
-            "rgb": rgb4.flatten().astype(np.uint8).tolist(),
+            "rgb": rgb4.ravel().astype(np.uint8),
             "width": 2,
             "height": 2
         },
         "expected": {
-            "yuv": yuv4.flatten().tolist()
+            "yuv": yuv4.ravel()
         }
-    })
-    
-    # Test case 5: Single pixel (for simple validation)
-    bgr5 = np.array([[[200, 150, 100]]], dtype=np.float32)  # BGR format
-    yuv5 = cv2.cvtColor(bgr5, cv2.COLOR_BGR2YUV)
+    }
     
-    # Convert BGR to RGB for consistent input format  
-    rgb5 = cv2.cvtColor(bgr5, cv2.COLOR_BGR2RGB)
+    # Convert BGR to RGB for consistent input format
+    rgb5 = bgr5[..., ::-1]
     
-    test_cases.append({
+    yield {
         "name": "1x1_single_pixel",
         "input": {
-            "rgb": rgb5.flatten().astype(np.uint8).tolist(),
+            "rgb": rgb5.ravel().astype(np.uint8),
             "width": 1,
             "height": 1
         },
         "expected": {
-            "yuv": yuv5.flatten().tolist()
+            "yuv": yuv5.ravel()
         }
-    })
+    }
     
-    return test_cases
 
 def main():
     print("Creating YUV conversion test cases...")
     
-    test_cases = create_yuv_test_cases()
-    
-    # Output to JSON file
-    with open('../internal/test/testcase/yuv_test_cases.json', 'w') as f:
-        json.dump(test_cases, f, indent=2)
+    np.set_printoptions(precision=6, suppress=True)
     
-    print(f"Generated {len(test_cases)} test cases in yuv_test_cases.json")
-    
-    # Display results
-    for i, case in enumerate(test_cases):
+    # Stream each case to the JSON file as soon as it is generated
+    count = 0
+    for i, case in enumerate(stream_test_cases('../internal/test/testcase/yuv_test_cases.json', create_yuv_test_cases())):
+        count += 1
+        
+        # Display results
         print(f"\nTest case {i+1}: {case['name']}")
         print(f"Input shape: {case['input']['height']}x{case['input']['width']}")
         rgb_data = case['input']['rgb']
@@ -145,6 +153,8 @@ def main():
             r, g, b = rgb_data[0], rgb_data[1], rgb_data[2]
             y, u, v = yuv_data[0], yuv_data[1], yuv_data[2]
             print(f"First pixel: RGB({r}, {g}, {b}) -> YUV({y}, {u}, {v})")
+    
+    print(f"\nGenerated {count} test cases in yuv_test_cases.json")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file